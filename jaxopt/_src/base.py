@@ -137,7 +137,7 @@ class IterativeSolver(Solver):
   def _cond_fun(self, inputs):
     _, state = inputs[0]
     if self.verbose:
-      print("error:", state.error)
+      jax.debug.print("error: {error}", error=state.error)
     return state.error > self.tol
 
   def _body_fun(self, inputs):
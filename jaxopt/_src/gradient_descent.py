@@ -40,12 +40,20 @@ class GradientDescent(ProximalGradient):
     tol: tolerance to use.
     acceleration: whether to use acceleration (also known as FISTA) or not.
     verbose: whether to print error on every iteration or not.
-      Warning: verbose=True will automatically disable jit.
+      Unlike other solvers, verbose=True does not disable jit.
     implicit_diff: whether to enable implicit diff or autodiff of unrolled
       iterations.
     implicit_diff_solve: the linear system solver to use.
     has_aux: whether function fun outputs one (False) or more values (True).
       When True it will be assumed by default that fun(...)[0] is the objective.
+    error_from_step: whether to compute the error from the step just taken,
+      as ``||next_x - x|| / stepsize`` (the gradient norm), instead of from an
+      additional gradient evaluation. With acceleration, this is the gradient
+      norm at the extrapolated point ``y`` rather than at the returned
+      parameters (default: False).
+    check_every: compute the error only every ``check_every`` iterations;
+      in between, the error of the last check is kept in the state
+      (default: 1).
   """
 
   def init_state(self,
@@ -60,8 +60,14 @@ def _while_loop_lax(cond_fun, body_fun, init_val, maxiter):
   return jax.lax.while_loop(_cond_fun, _body_fun, (0, init_val))[1]
 
 
-def while_loop(cond_fun, body_fun, init_val, maxiter, unroll=False, jit=False):
-  """A while loop with a bounded number of iterations."""
+def while_loop(cond_fun, body_fun, init_val, maxiter, unroll=False, jit=False,
+               nested_jit=True):
+  """A while loop with a bounded number of iterations.
+
+  When ``unroll`` and ``jit`` are both True, the loop is wrapped in its own
+  ``jax.jit``. Callers that are already traced under ``jax.jit`` can pass
+  ``nested_jit=False`` to skip this redundant wrapper.
+  """
 
   if unroll:
     if jit:
@@ -74,7 +80,7 @@ def while_loop(cond_fun, body_fun, init_val, maxiter, unroll=False, jit=False):
     else:
       raise ValueError("unroll=False and jit=False cannot be used together")
 
-  if jit and fun is not _while_loop_lax:
+  if jit and nested_jit and fun is not _while_loop_lax:
     # jit of a lax while_loop is redundant, and this jit would only
     # constrain maxiter to be static where it is not required.
     fun = jax.jit(fun, static_argnums=(0, 1, 3))
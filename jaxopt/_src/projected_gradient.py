@@ -47,12 +47,19 @@ class ProjectedGradient(base.IterativeSolver):
     tol: tolerance to use.
     acceleration: whether to use acceleration (also known as FISTA) or not.
     verbose: whether to print error on every iteration or not.
-      Warning: verbose=True will automatically disable jit.
+      Unlike other solvers, verbose=True does not disable jit.
     implicit_diff: whether to enable implicit diff or autodiff of unrolled
       iterations.
     implicit_diff_solve: the linear system solver to use.
     has_aux: whether function fun outputs one (False) or more values (True).
       When True it will be assumed by default that fun(...)[0] is the objective.
+    error_from_step: whether to compute the error from the step just taken,
+      as ``||next_x - x|| / stepsize``, instead of from an additional projected
+      gradient step with unit stepsize. With acceleration, the step is taken
+      from the extrapolated point ``y`` (default: False).
+    check_every: compute the error only every ``check_every`` iterations;
+      in between, the error of the last check is kept in the state
+      (default: 1).
     jit: whether to JIT-compile the optimization loop (default: "auto").
     unroll: whether to unroll the optimization loop (default: "auto").
   """
@@ -68,6 +75,8 @@ class ProjectedGradient(base.IterativeSolver):
   implicit_diff: bool = True
   implicit_diff_solve: Optional[Callable] = None
   has_aux: bool = False
+  error_from_step: bool = False
+  check_every: int = 1
   jit: base.AutoOrBoolean = "auto"
   unroll: base.AutoOrBoolean = "auto"
 
@@ -132,5 +141,7 @@ class ProjectedGradient(base.IterativeSolver):
                                 verbose=self.verbose,
                                 implicit_diff=self.implicit_diff,
                                 has_aux=self.has_aux,
+                                error_from_step=self.error_from_step,
+                                check_every=self.check_every,
                                 jit=self.jit,
                                 unroll=self.unroll)
@@ -32,9 +32,9 @@ from jaxopt._src import base
 from jaxopt._src import loop
 from jaxopt._src.prox import prox_none
 from jaxopt._src.tree_util import tree_add_scalar_mul
+from jaxopt._src.tree_util import tree_diff_sqnorm_vdot
 from jaxopt._src.tree_util import tree_l2_norm
 from jaxopt._src.tree_util import tree_sub
-from jaxopt._src.tree_util import tree_vdot
 
 
 def fista_line_search(
@@ -52,32 +52,40 @@ def fista_line_search(
   args,
   kwargs):
   # epsilon of current dtype for robust checking of
-  # sufficient decrease condition
-  eps = jnp.finfo(x_fun_val.dtype).eps
+  # sufficient decrease condition. The dtype is static, so this is a Python
+  # constant that gets folded into the comparison.
+  eps = float(jnp.finfo(x_fun_val.dtype).eps)
 
-  def cond_fun(pair):
-    next_x, stepsize = pair
-    diff_x = tree_sub(next_x, x)
-    sqdist = tree_l2_norm(diff_x, squared=True)
+  def cond_fun(val):
+    next_x, stepsize, next_x_fun_val = val
+    sqdist, diff_x_vdot_grad = tree_diff_sqnorm_vdot(next_x, x, x_fun_grad)
     # The expression below checks the sufficient decrease condition
     # f(next_x) < f(x) + dot(grad_f(x), diff_x) + (0.5/stepsize) ||diff_x||^2
     # where the terms have been reordered for numerical stability.
-    fun_decrease = stepsize * (fun(next_x, *args, **kwargs) - x_fun_val)
-    condition = stepsize * tree_vdot(diff_x, x_fun_grad) + 0.5 * sqdist
+    fun_decrease = stepsize * (next_x_fun_val - x_fun_val)
+    condition = stepsize * diff_x_vdot_grad + 0.5 * sqdist
     return fun_decrease > condition + eps
 
-  def body_fun(pair):
-    stepsize = pair[1]
-    next_stepsize = stepsize * decrease_factor
-    next_x = prox_grad(x, x_fun_grad, next_stepsize, hyperparams_prox)
-    return next_x, next_stepsize
+  def trial(stepsize):
+    next_x = prox_grad(x, x_fun_grad, stepsize, hyperparams_prox)
+    next_x_fun_val = fun(next_x, *args, **kwargs)
+    return next_x, stepsize, next_x_fun_val
+
+  def body_fun(val):
+    stepsize = val[1]
+    return trial(stepsize * decrease_factor)
 
-  init_x = prox_grad(x, x_fun_grad, stepsize, hyperparams_prox)
-  init_val = (init_x, stepsize)
+  # The objective value of each trial point is stored in the loop carry,
+  # so that it is computed only once per trial.
+  init_val = trial(stepsize)
 
-  return loop.while_loop(cond_fun=cond_fun, body_fun=body_fun,
-                         init_val=init_val, maxiter=maxls,
-                         unroll=unroll, jit=jit)
+  # When jit is enabled, the line search is itself jitted (see __post_init__),
+  # so the loop does not need a nested jax.jit of its own.
+  next_val = loop.while_loop(cond_fun=cond_fun, body_fun=body_fun,
+                             init_val=init_val, maxiter=maxls,
+                             unroll=unroll, jit=jit, nested_jit=False)
+  next_x, next_stepsize, _ = next_val
+  return next_x, next_stepsize
 
 
 class ProxGradState(NamedTuple):
@@ -112,14 +120,28 @@ class ProximalGradient(base.IterativeSolver):
     acceleration: whether to use acceleration (also known as FISTA) or not.
     decrease_factor: factor by which to reduce the stepsize during line search.
     verbose: whether to print error on every iteration or not.
-      Warning: verbose=True will automatically disable jit.
+      Unlike other solvers, verbose=True does not disable jit.
     implicit_diff: whether to enable implicit diff or autodiff of unrolled
       iterations.
     implicit_diff_solve: the linear system solver to use.
     has_aux: whether function fun outputs one (False) or more values (True).
       When True it will be assumed by default that fun(...)[0] is the objective.
+    error_from_step: whether to compute the error from the step just taken,
+      as ``||next_x - x|| / stepsize`` (the norm of the gradient mapping),
+      instead of from an additional proximal gradient step with unit stepsize.
+      Both quantities vanish at a solution; the former saves one call to
+      ``prox`` per iteration (default: False). With acceleration, the step
+      is taken from the extrapolated point ``y``, so the error is
+      ``||next_x - y|| / stepsize``, the gradient mapping at ``y`` rather
+      than at the returned parameters.
+    check_every: compute the error only every ``check_every`` iterations;
+      in between, the error of the last check is kept in the state. This
+      saves the cost of the stopping criterion at the price of up to
+      ``check_every - 1`` extra iterations (default: 1).
     jit: whether to JIT-compile the optimization loop (default: "auto").
     unroll: whether to unroll the optimization loop (default: "auto").
+      When jit is enabled, the unrolled loop is implemented with
+      ``jax.lax.scan`` and is traced once, independently of ``maxiter``.
 
   References:
     Beck, Amir, and Marc Teboulle. "A fast iterative shrinkage-thresholding
@@ -140,6 +162,8 @@ class ProximalGradient(base.IterativeSolver):
   implicit_diff: bool = True
   implicit_diff_solve: Optional[Callable] = None
   has_aux: bool = False
+  error_from_step: bool = False
+  check_every: int = 1
   jit: base.AutoOrBoolean = "auto"
   unroll: base.AutoOrBoolean = "auto"
 
@@ -173,12 +197,48 @@ class ProximalGradient(base.IterativeSolver):
 
     return state
 
+  def _get_loop_options(self):
+    """Returns jit and unroll options based on user-provided attributes."""
+    # The error is printed with jax.debug.print, so verbose mode does not
+    # require disabling jit.
+    jit = True if self.jit == "auto" else self.jit
+
+    if self.unroll == "auto":
+      # Unrolling is only needed for autodiff through the iterations; under
+      # jit it is scan-based, without jit it is a Python loop.
+      unroll = not self.implicit_diff or not jit
+    else:
+      unroll = self.unroll
+
+    return jit, unroll
+
   def _error(self, x, x_fun_grad, hyperparams_prox):
     next_x = self._prox_grad(x, x_fun_grad, 1.0, hyperparams_prox)
     diff_x = tree_sub(next_x, x)
     return tree_l2_norm(diff_x)
 
+  def _lazy_error(self, iter_num, error, error_fun, aux_fun=lambda: None):
+    # error_fun returns a pair (error, aux). On iterations where the error is
+    # not recomputed, the previous error is kept and aux_fun computes aux.
+    if self.check_every == 1:
+      return error_fun()
+    error = jnp.asarray(error)
+
+    def check(_):
+      next_error, aux = error_fun()
+      return next_error.astype(error.dtype), aux
+
+    return jax.lax.cond(iter_num % self.check_every == 0,
+                        check,
+                        lambda _: (error, aux_fun()),
+                        operand=None)
+
+  def _step_error(self, x, next_x, stepsize):
+    return tree_l2_norm(tree_sub(next_x, x)) / stepsize
+
   def _prox_grad(self, x, x_fun_grad, stepsize, hyperparams_prox):
+    # Under jit, XLA fuses this update into elementwise proximity operators,
+    # so the intermediate pytree is not materialized.
     update = tree_add_scalar_mul(x, -stepsize, x_fun_grad)
     return self.prox(update, hyperparams_prox, stepsize)
 
@@ -192,18 +252,20 @@ class ProximalGradient(base.IterativeSolver):
             args,
             kwargs):
 
-    if not isinstance(self.stepsize, Callable) and self.stepsize <= 0:
+    if self._use_line_search:
       # with line search
-      next_x, next_stepsize = self._fista_line_search(self.maxls, x, x_fun_val,
+      next_x, curr_stepsize = self._fista_line_search(self.maxls, x, x_fun_val,
                                                       x_fun_grad, stepsize,
                                                       self.decrease_factor,
                                                       hyperparams_prox, args,
                                                       kwargs)
       # If step size becomes too small, we restart it to 1.0.
-      # Otherwise, we attempt to increase it.
-      next_stepsize = jnp.where(next_stepsize <= 1e-6, 1.0,
-                                next_stepsize / self.decrease_factor)
-      return next_x, next_stepsize
+      # Otherwise, we attempt to increase it. The reciprocal of
+      # decrease_factor is a Python constant, so this is a multiplication.
+      increase_factor = 1.0 / self.decrease_factor
+      next_stepsize = jnp.where(curr_stepsize <= 1e-6, 1.0,
+                                curr_stepsize * increase_factor)
+      return next_x, curr_stepsize, next_stepsize
     else:
       # without line search
       if isinstance(self.stepsize, Callable):
@@ -211,16 +273,22 @@ class ProximalGradient(base.IterativeSolver):
       else:
         next_stepsize = self.stepsize
       next_x = self._prox_grad(x, x_fun_grad, next_stepsize, hyperparams_prox)
-      return next_x, next_stepsize
+      return next_x, next_stepsize, next_stepsize
 
   def _update(self, x, state, hyperparams_prox, args, kwargs):
     iter_num = state.iter_num
     stepsize = state.stepsize
     (x_fun_val, aux), x_fun_grad = self._value_and_grad_with_aux(x, *args,
                                                                  **kwargs)
-    next_x, next_stepsize = self._iter(iter_num, x, x_fun_val, x_fun_grad,
-                                       stepsize, hyperparams_prox, args, kwargs)
-    error = self._error(x, x_fun_grad, hyperparams_prox)
+    next_x, curr_stepsize, next_stepsize = self._iter(iter_num, x, x_fun_val,
+                                                      x_fun_grad, stepsize,
+                                                      hyperparams_prox, args,
+                                                      kwargs)
+    if self.error_from_step:
+      error_fun = lambda: (self._step_error(x, next_x, curr_stepsize), None)
+    else:
+      error_fun = lambda: (self._error(x, x_fun_grad, hyperparams_prox), None)
+    error, _ = self._lazy_error(iter_num, state.error, error_fun)
     next_state = ProxGradState(iter_num=iter_num + 1,
                                stepsize=next_stepsize,
                                error=error, aux=aux)
@@ -232,13 +300,30 @@ class ProximalGradient(base.IterativeSolver):
     t = state.t
     stepsize = state.stepsize
     y_fun_val, y_fun_grad = self._value_and_grad_fun(y, *args, **kwargs)
-    next_x, next_stepsize = self._iter(iter_num, y, y_fun_val, y_fun_grad,
-                                       stepsize, hyperparams_prox, args, kwargs)
+    next_x, curr_stepsize, next_stepsize = self._iter(iter_num, y, y_fun_val,
+                                                      y_fun_grad, stepsize,
+                                                      hyperparams_prox, args,
+                                                      kwargs)
     next_t = 0.5 * (1 + jnp.sqrt(1 + 4 * t ** 2))
     diff_x = tree_sub(next_x, x)
     next_y = tree_add_scalar_mul(next_x, (t - 1) / next_t, diff_x)
-    next_x_fun_grad, aux = self._grad_with_aux(next_x, *args, **kwargs)
-    next_error = self._error(next_x, next_x_fun_grad, hyperparams_prox)
+    # The gradient at next_x is only needed by the error. When it is not
+    # computed, fun is only evaluated at next_x if aux must be returned.
+    def aux_fun():
+      return self.fun(next_x, *args, **kwargs)[1] if self.has_aux else None
+
+    if self.error_from_step:
+      def error_fun():
+        return self._step_error(y, next_x, curr_stepsize), aux_fun()
+    else:
+      def error_fun():
+        (_, aux), next_x_fun_grad = self._value_and_grad_with_aux(next_x,
+                                                                  *args,
+                                                                  **kwargs)
+        return self._error(next_x, next_x_fun_grad, hyperparams_prox), aux
+
+    next_error, aux = self._lazy_error(iter_num, state.error, error_fun,
+                                       aux_fun)
     next_state = ProxGradState(iter_num=iter_num + 1, velocity=next_y, t=next_t,
                                stepsize=next_stepsize, error=next_error,
                                aux=aux)
@@ -280,10 +365,6 @@ class ProximalGradient(base.IterativeSolver):
   def _grad_fun(self, params, *args, **kwargs):
     return self._value_and_grad_fun(params, *args, **kwargs)[1]
 
-  def _grad_with_aux(self, params, *args, **kwargs):
-    (value, aux), grad = self._value_and_grad_with_aux(params, *args, **kwargs)
-    return grad, aux
-
   def __post_init__(self):
     if self.has_aux:
       self._fun = lambda *a, **kw: self.fun(*a, **kw)[0]
@@ -304,13 +385,21 @@ class ProximalGradient(base.IterativeSolver):
     parameters.insert(1, new_param)
     self.reference_signature = inspect.Signature(parameters)
 
-    jit, unroll = self._get_loop_options()
+    if self.check_every < 1:
+      raise ValueError("check_every should be greater or equal to 1.")
 
-    fista_ls_with_fun= partial(fista_line_search, self._fun, self._prox_grad,
-                               jit, unroll)
+    # The line search is only built when it is used, so that fixed stepsizes
+    # do not pay for it at trace time.
+    self._use_line_search = (not isinstance(self.stepsize, Callable) and
+                             self.stepsize <= 0)
+    if self._use_line_search:
+      jit, unroll = self._get_loop_options()
 
-    if jit:
-      jitted_fista_ls_with_fun = jax.jit(fista_ls_with_fun, static_argnums=(0,))
-      self._fista_line_search = jitted_fista_ls_with_fun
-    else:
-      self._fista_line_search = fista_ls_with_fun
+      fista_ls_with_fun= partial(fista_line_search, self._fun, self._prox_grad,
+                                 jit, unroll)
+
+      if jit:
+        self._fista_line_search = jax.jit(fista_ls_with_fun,
+                                          static_argnums=(0,))
+      else:
+        self._fista_line_search = fista_ls_with_fun
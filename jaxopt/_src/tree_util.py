@@ -104,6 +104,20 @@ def tree_vdot(tree_x, tree_y):
   return tree_reduce(operator.add, vdots)
 
 
+def tree_diff_sqnorm_vdot(tree_x, tree_y, tree_z):
+  """Compute ||tree_x - tree_y||^2 and <tree_x - tree_y, tree_z>.
+
+  Both reductions are computed in a single traversal, without materializing
+  the pytree tree_x - tree_y."""
+  def _leaf(x, y, z):
+    diff = jnp.asarray(x) - jnp.asarray(y)
+    return _vdot_safe(diff, diff), _vdot_safe(diff, z)
+  pairs = tree_map(_leaf, tree_x, tree_y, tree_z)
+  sqnorms, vdots = tu.tree_transpose(tu.tree_structure(tree_x),
+                                     tu.tree_structure((0, 0)), pairs)
+  return tree_reduce(operator.add, sqnorms), tree_reduce(operator.add, vdots)
+
+
 def tree_dot(tree_x, tree_y):
   """Compute leaves-wise dot product between pytree of arrays.
 
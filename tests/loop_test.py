@@ -66,6 +66,24 @@ class LoopTest(test_util.JaxoptTestCase):
       self.assertEqual(jax.grad(my_pow)(3.0, 6, max_val=81),
                        jax.grad(jnp.power)(3.0, 4))
 
+  @parameterized.product(nested_jit=[True, False])
+  def test_while_loop_nested_jit(self, nested_jit):
+    def my_pow(x):
+      def body_fun(val):
+        return val * x
+      def cond_fun(val):
+        return True
+      return loop.while_loop(cond_fun=cond_fun, body_fun=body_fun, init_val=1.0,
+                             maxiter=4, unroll=True, jit=True,
+                             nested_jit=nested_jit)
+
+    self.assertEqual(jax.jit(my_pow)(3.0), pow(3.0, 4))
+
+    # Without nested jit, the scan is inlined in the caller's trace.
+    primitives = [eqn.primitive.name for eqn in
+                  jax.make_jaxpr(my_pow)(3.0).jaxpr.eqns]
+    self.assertEqual("scan" not in primitives, nested_jit)
+
 
 if __name__ == '__main__':
   absltest.main()
@@ -63,6 +63,26 @@ class ProjectedGradientTest(test_util.JaxoptTestCase):
     pg_sol = pg.run(w_init, hyperparams_proj=1.0, data=(X, y)).params
     self.assertLess(jnp.sqrt(jnp.sum(pg_sol ** 2)), 1.0)
 
+  def test_projected_gradient_check_every(self):
+    rng = onp.random.RandomState(0)
+    X = rng.randn(10, 5)
+    w = rng.rand(5)
+    y = jnp.dot(X, w)
+    fun = objective.least_squares
+    w_init = jnp.zeros_like(w)
+
+    pg = ProjectedGradient(fun=fun,
+                           projection=projection.projection_non_negative)
+    pg_sol = pg.run(w_init, data=(X, y)).params
+
+    pg_lazy = ProjectedGradient(fun=fun,
+                                projection=projection.projection_non_negative,
+                                error_from_step=True, check_every=5)
+    pg_lazy_sol, state = pg_lazy.run(w_init, data=(X, y))
+
+    self.assertEqual((state.iter_num - 1) % 5, 0)
+    self.assertArraysAllClose(pg_sol, pg_lazy_sol, atol=1e-2)
+
   def test_projected_gradient_l2_ball_manual_loop(self):
     rng = onp.random.RandomState(0)
     X = rng.randn(10, 5)
@@ -80,6 +80,117 @@ class ProximalGradientTest(test_util.JaxoptTestCase):
     w_skl = test_util.lasso_skl(X, y, lam)
     self.assertArraysAllClose(w_fit, w_skl, atol=1e-2)
 
+  @parameterized.product(acceleration=[True, False])
+  def test_lasso_unroll(self, acceleration):
+    X, y = datasets.make_regression(n_samples=10, n_features=3, random_state=0)
+    fun = objective.least_squares
+    lam = 10.0
+    data = (X, y)
+
+    w_init = jnp.zeros(X.shape[1])
+    kw = dict(fun=fun, prox=prox.prox_lasso, maxiter=200, tol=1e-3,
+              acceleration=acceleration)
+    w_fit, info = ProximalGradient(unroll=False, **kw).run(w_init, lam, data)
+    w_fit_unroll, info_unroll = ProximalGradient(unroll=True, **kw).run(
+        w_init, lam, data)
+
+    self.assertLess(info_unroll.error, 1e-3)
+    self.assertArraysAllClose(w_fit, w_fit_unroll, atol=1e-3)
+
+  def test_unroll_traces_once(self):
+    X, y = datasets.make_regression(n_samples=10, n_features=3, random_state=0)
+    data = (X, y)
+
+    def num_traces(maxiter):
+      count = [0]
+      def fun(w, data):
+        count[0] += 1
+        return objective.least_squares(w, data)
+      pg = ProximalGradient(fun=fun, prox=prox.prox_lasso, maxiter=maxiter,
+                            implicit_diff=False)
+      pg.run(jnp.zeros(X.shape[1]), 10.0, data)
+      return count[0]
+
+    # The unrolled loop is scan-based, so tracing does not depend on maxiter.
+    self.assertEqual(num_traces(10), num_traces(500))
+
+  def test_verbose_jit(self):
+    X, y = datasets.make_regression(n_samples=10, n_features=3, random_state=0)
+    data = (X, y)
+
+    def num_calls(verbose):
+      count = [0]
+      def fun(w, data):
+        count[0] += 1
+        return objective.least_squares(w, data)
+      pg = ProximalGradient(fun=fun, prox=prox.prox_lasso, maxiter=50,
+                            tol=1e-6, verbose=verbose)
+      pg.run(jnp.zeros(X.shape[1]), 10.0, data)
+      return count[0]
+
+    # With jit, fun is only called while tracing, not once per iteration.
+    self.assertEqual(num_calls(verbose=True), num_calls(verbose=False))
+    self.assertLess(num_calls(verbose=True), 50)
+
+  @parameterized.product(acceleration=[True, False])
+  def test_lasso_error_from_step(self, acceleration):
+    X, y = datasets.make_regression(n_samples=10, n_features=3, random_state=0)
+    fun = objective.least_squares
+    lam = 10.0
+    data = (X, y)
+
+    w_init = jnp.zeros(X.shape[1])
+    pg = ProximalGradient(fun=fun, prox=prox.prox_lasso, maxiter=500,
+                          tol=1e-3, acceleration=acceleration,
+                          error_from_step=True)
+    w_fit, info = pg.run(w_init, hyperparams_prox=lam, data=data)
+
+    self.assertLess(info.error, 1e-3)
+    w_skl = test_util.lasso_skl(X, y, lam)
+    self.assertArraysAllClose(w_fit, w_skl, atol=1e-2)
+
+  @parameterized.product(acceleration=[True, False],
+                         error_from_step=[True, False])
+  def test_lasso_check_every(self, acceleration, error_from_step):
+    X, y = datasets.make_regression(n_samples=10, n_features=3, random_state=0)
+    fun = objective.least_squares
+    lam = 10.0
+    data = (X, y)
+
+    w_init = jnp.zeros(X.shape[1])
+    pg = ProximalGradient(fun=fun, prox=prox.prox_lasso, maxiter=500,
+                          tol=1e-3, acceleration=acceleration,
+                          error_from_step=error_from_step, check_every=5)
+    w_fit, info = pg.run(w_init, hyperparams_prox=lam, data=data)
+
+    self.assertLess(info.error, 1e-3)
+    # The error is only refreshed every 5 iterations.
+    self.assertEqual((info.iter_num - 1) % 5, 0)
+    w_skl = test_util.lasso_skl(X, y, lam)
+    self.assertArraysAllClose(w_fit, w_skl, atol=1e-2)
+
+  @parameterized.product(error_from_step=[True, False])
+  def test_check_every_has_aux(self, error_from_step):
+    X, y = datasets.make_regression(n_samples=10, n_features=3, random_state=0)
+    data = (X, y)
+
+    def fun(w, data):
+      return objective.least_squares(w, data), jnp.sum(w)
+
+    pg = ProximalGradient(fun=fun, prox=prox.prox_lasso, has_aux=True,
+                          error_from_step=error_from_step, check_every=3)
+    params = jnp.zeros(X.shape[1])
+    state = pg.init_state(params, hyperparams_prox=10.0, data=data)
+    for _ in range(4):
+      params, state = pg.update(params, state, hyperparams_prox=10.0,
+                                data=data)
+      # aux is computed at every iteration, not only when checking the error.
+      self.assertAllClose(state.aux, jnp.sum(params))
+
+  def test_check_every_invalid(self):
+    with self.assertRaises(ValueError):
+      ProximalGradient(fun=objective.least_squares, check_every=0)
+
   def test_lasso_implicit_diff(self):
     """Test implicit differentiation of a single lambda parameter."""
     X, y = datasets.make_regression(n_samples=10, n_features=3, random_state=0)
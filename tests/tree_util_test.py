@@ -101,6 +101,22 @@ class TreeUtilTest(test_util.JaxoptTestCase):
     got = tree_util.tree_vdot(self.tree_A, self.tree_B)
     self.assertAllClose(expected, got)
 
+  def test_tree_diff_sqnorm_vdot(self):
+    diff = self.array_A - self.array_B
+    expected = (jnp.vdot(diff, diff), jnp.vdot(diff, self.array_A))
+    got = tree_util.tree_diff_sqnorm_vdot(self.array_A, self.array_B,
+                                          self.array_A)
+    self.assertAllClose(expected, got)
+
+    diff = tree_util.tree_sub(self.tree_A, self.tree_B)
+    expected = (tree_util.tree_l2_norm(diff, squared=True),
+                tree_util.tree_vdot(diff, self.tree_A))
+    got = tree_util.tree_diff_sqnorm_vdot(self.tree_A, self.tree_B, self.tree_A)
+    self.assertAllClose(expected, got)
+
+    with self.assertRaises(ValueError):
+      tree_util.tree_diff_sqnorm_vdot(self.tree_A, self.tree_B, self.tree_A[0])
+
   def test_tree_div(self):
     expected = (self.tree_A[0] / self.tree_B[0], self.tree_A[1] / self.tree_B[1])
     got = tree_util.tree_div(self.tree_A, self.tree_B)